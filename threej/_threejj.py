@@ -3,6 +3,11 @@
 from math import sqrt, fabs, copysign
 from sys import float_info
 
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
 # constants
 EPS = .01
 
@@ -14,6 +19,53 @@ TINY = 1/HUGE
 SRTINY = 1/SRHUGE
 
 
+def _rescale(thrcof, start, stop):
+    '''divide thrcof[start:stop] by SRHUGE, setting values below SRTINY to 0'''
+    if np is not None and isinstance(thrcof, np.ndarray):
+        x = thrcof[start:stop]
+        small = np.fabs(x) < SRTINY
+        x /= SRHUGE
+        x[small] = 0
+    else:
+        _rescale_loop(thrcof, start, stop)
+
+
+def _rescale_loop(thrcof, start, stop):
+    '''_rescale() for sequences'''
+    for j in range(start, stop):
+        if fabs(thrcof[j]) < SRTINY:
+            thrcof[j] = 0
+        else:
+            thrcof[j] /= SRHUGE
+
+
+def _scale(thrcof, start, stop, factor, thresh):
+    '''multiply thrcof[start:stop] by factor, zero values below thresh'''
+    if np is not None and isinstance(thrcof, np.ndarray):
+        x = thrcof[start:stop]
+        if thresh > 0:
+            small = np.fabs(x) < thresh
+            x *= factor
+            x[small] = 0
+        else:
+            x *= factor
+    else:
+        _scale_loop(thrcof, start, stop, factor, thresh)
+
+
+def _scale_loop(thrcof, start, stop, factor, thresh):
+    '''_scale() for sequences'''
+    if thresh > 0:
+        for j in range(start, stop):
+            if fabs(thrcof[j]) < thresh:
+                thrcof[j] = 0
+            else:
+                thrcof[j] = factor * thrcof[j]
+    else:
+        for j in range(start, stop):
+            thrcof[j] *= factor
+
+
 def _threejj(l2, l3, m2, m3, out):
     def norm(l2, l3, m2, m3, sumuni, thrcof):
         # Normalize 3j coefficients
@@ -27,14 +79,9 @@ def _threejj(l2, l3, m2, m3, out):
 
         if fabs(cnorm) < 1:
             thresh = TINY / fabs(cnorm)
-            for n in range(len(thrcof)):
-                if fabs(thrcof[n]) < thresh:
-                    thrcof[n] = 0
-                else:
-                    thrcof[n] = cnorm * thrcof[n]
         else:
-            for n in range(len(thrcof)):
-                thrcof[n] = cnorm * thrcof[n]
+            thresh = 0.
+        _scale(thrcof, 0, len(thrcof), cnorm, thresh)
 
     # cast parameters to float (for numba typing)
     l2, l3, m2, m3 = float(l2), float(l3), float(m2), float(m3)
@@ -131,11 +178,7 @@ def _threejj(l2, l3, m2, m3, out):
                 # This is reached if last 3j coefficient larger than SRHUGE,
                 # so that the recursion series thrcof[0], ... , thrcof[n]
                 # has to be rescaled to prevent overflow
-                for j in range(n+1):
-                    if fabs(thrcof[j]) < SRTINY:
-                        thrcof[j] = 0
-                    else:
-                        thrcof[j] /= SRHUGE
+                _rescale(thrcof, 0, n+1)
                 sumfor /= HUGE
                 sum1 /= HUGE
 
@@ -201,11 +244,7 @@ def _threejj(l2, l3, m2, m3, out):
                 # This is reached if last 3j coefficient larger than SRHUGE,
                 # so that the recursion series thrcof[-1], ... , thrcof[-n]
                 # has to be rescaled to prevent overflow
-                for j in range(1, n+1):
-                    if fabs(thrcof[-j]) < SRTINY:
-                        thrcof[-j] = 0
-                    else:
-                        thrcof[-j] /= SRHUGE
+                _rescale(thrcof, nfin-n, nfin)
                 sumbac /= HUGE
                 sum2 /= HUGE
 
@@ -219,13 +258,11 @@ def _threejj(l2, l3, m2, m3, out):
     nlim = nfin - nbac + 1
 
     if fabs(ratio) >= 1:
-        for n in range(nlim):
-            thrcof[n] *= ratio
+        _scale(thrcof, 0, nlim, ratio, 0.)
         sumuni = ratio * ratio * sumfor + sumbac
     else:
         ratio = 1 / ratio
-        for n in range(nlim, nfin):
-            thrcof[n] *= ratio
+        _scale(thrcof, nlim, nfin, ratio, 0.)
         sumuni = sumfor + ratio*ratio*sumbac
 
     norm(l2, l3, m2, m3, sumuni, thrcof)
@@ -269,11 +306,7 @@ def _threejj_00(l2, l3, thrcof):
             # This is reached if last 3j coefficient larger than SRHUGE,
             # so that the recursion series thrcof[-1], ... , thrcof[-n]
             # has to be rescaled to prevent overflow
-            for j in range(1, n+1):
-                if fabs(thrcof[-j]) < SRTINY:
-                    thrcof[-j] = 0
-                else:
-                    thrcof[-j] /= SRHUGE
+            _rescale(thrcof, nfin-n, nfin)
             sum2 /= HUGE
 
     # Normalize 3j coefficients
@@ -287,19 +320,14 @@ def _threejj_00(l2, l3, thrcof):
 
     if fabs(cnorm) < 1:
         thresh = TINY / fabs(cnorm)
-        for n in range(nfin):
-            if fabs(thrcof[n]) < thresh:
-                thrcof[n] = 0
-            else:
-                thrcof[n] = cnorm * thrcof[n]
     else:
-        for n in range(nfin):
-            thrcof[n] = cnorm * thrcof[n]
+        thresh = 0.
+    _scale(thrcof, 0, nfin, cnorm, thresh)
 
     return l1min, thrcof
 
 
-def threejj(l2, l3, m2, m3, out=None):
+def threejj(l2, l3, m2, m3, out=None, asarray=False):
     r'''Evaluate the Wigner 3j symbol
 
     .. code-block:: text
@@ -316,6 +344,9 @@ def threejj(l2, l3, m2, m3, out=None):
     out : array_like, optional
         Output array for coefficients.  Must have space for ``l1max-l1min+1``
         elements.  If ``None``, a new array is created.
+    asarray : bool, optional
+        If ``out`` is ``None``, create a NumPy array instead of a list.
+        Requires NumPy.
 
     Returns
     -------
@@ -392,5 +423,10 @@ def threejj(l2, l3, m2, m3, out=None):
         l1min = max(abs(l2-l3), abs(m2+m3))
         l1max = l2+l3
         n = max(int(l1max-l1min+1+EPS), 0)
-        out = [0.]*n
+        if asarray:
+            if np is None:
+                raise ImportError('asarray requires numpy')
+            out = np.zeros(n)
+        else:
+            out = [0.]*n
     return _threejj(l2, l3, m2, m3, out)
@@ -26,19 +26,29 @@ def _(l2, l3, thrcof):
     return _threejj._threejj_00
 
 
+@overload(_threejj._rescale, jit_options=dict(nogil=True, fastmath=True))
+def _(thrcof, start, stop):
+    return _threejj._rescale_loop
+
+
+@overload(_threejj._scale, jit_options=dict(nogil=True, fastmath=True))
+def _(thrcof, start, stop, factor, thresh):
+    return _threejj._scale_loop
+
+
 @overload(_threejj.threejj)
-def _(l2, l3, m2, m3, out=None):
+def _(l2, l3, m2, m3, out=None, asarray=False):
     if isinstance(out, types.Optional):
         out = out.type
 
     if isinstance(out, types.NoneType):
-        def threejj(l2, l3, m2, m3, out=None):
+        def threejj(l2, l3, m2, m3, out=None, asarray=False):
             l1min = max(abs(l2-l3), abs(m2+m3))
             l1max = l2+l3
             n = max(int(l1max-l1min+1.1), 0)
             return _threejj._threejj(l2, l3, m2, m3, out=np.empty(n))
     else:
-        def threejj(l2, l3, m2, m3, out=None):
+        def threejj(l2, l3, m2, m3, out=None, asarray=False):
             return _threejj._threejj(l2, l3, m2, m3, out=out)
 
     return threejj
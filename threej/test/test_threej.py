@@ -1,6 +1,13 @@
 import unittest
+from unittest import mock
 
 from threej import threejj
+from threej import _threejj
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
 
 
 class TestThreejj(unittest.TestCase):
@@ -106,6 +113,42 @@ class TestThreejj(unittest.TestCase):
     def test_out(self):
         self.assertThreejj(10, 12, 3, -4, out=[0.]*100)
 
+    @unittest.skipIf(np is None, 'requires numpy')
+    def test_out_ndarray(self):
+        out = np.zeros(100)
+        self.assertThreejj(10, 12, 3, -4, out=out)
+        self.assertThreejj(5, 3, 0, 0, out=out)
+        self.assertThreejj(10000, 10000, 0, 0, out=np.zeros(20001))
+        self.assertThreejj(1000, 10000, 0, 0, out=np.zeros(2001))
+
+    @unittest.skipIf(np is None, 'requires numpy')
+    def test_asarray(self):
+        l1min, thrcof = threejj(10, 12, 3, -4, asarray=True)
+        self.assertIsInstance(thrcof, np.ndarray)
+        self.assertArrayAlmostEqual(thrcof, self.values[10, 12, 3, -4])
+
+    def test_asarray_without_numpy(self):
+        with mock.patch.object(_threejj, 'np', None):
+            with self.assertRaises(ImportError):
+                threejj(10, 12, 3, -4, asarray=True)
+
+    @unittest.skipIf(np is None, 'requires numpy')
+    def test_rescale_ndarray(self):
+        x = [1e-200, _threejj.SRTINY/2, 3e160, -2., _threejj.SRTINY]
+        a, b = list(x), np.array(x)
+        _threejj._rescale(a, 1, 5)
+        _threejj._rescale(b, 1, 5)
+        self.assertEqual(b.tolist(), a)
+
+    @unittest.skipIf(np is None, 'requires numpy')
+    def test_scale_ndarray(self):
+        x = [1e-300, -5., 2., 1e-310]
+        for thresh in 0., 1e-299:
+            a, b = list(x), np.array(x)
+            _threejj._scale(a, 1, 4, .5, thresh)
+            _threejj._scale(b, 1, 4, .5, thresh)
+            self.assertEqual(b.tolist(), a)
+
     def test_errors(self):
         with self.assertRaises(ValueError):
             threejj(0, 0, 1, 0)